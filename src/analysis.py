@@ -29,44 +29,96 @@ EXTENDED ANALYSIS (INCLUDED BY DEFAULT)
 
 import pandas as pd
 import numpy as np
+from itertools import combinations
 from pathlib import Path
-from scipy.stats import norm
+from scipy.stats import norm, spearmanr, kendalltau
+
+from data_io import load_csv
+from jit import njit
+
+
+@njit(parallel=True, cache=True)
+def _outlier_kernel(x, lower, upper):
+    """Count values outside [lower, upper] (NaN never counts as an outlier)."""
+    return ((x < lower) | (x > upper)).sum()
 
 
 class DataAnalyzer:
+    # Identify a student but play no part in the analysis
+    UNUSED_TEXT_COLUMNS = ("first_name", "last_name", "email")
+
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
-        self.df = pd.read_csv(csv_path)
+        df = load_csv(csv_path)
+
+        # Keep student_id so filtered rows stay identifiable; drop the other text columns
+        self.df = df.drop(columns=[c for c in self.UNUSED_TEXT_COLUMNS if c in df.columns])
+
+    def _values(self, column):
+        """Non-missing values of a column as a contiguous float64 array."""
+        return self.df[column].dropna().to_numpy(dtype=np.float64)
 
     # ================================================================
     # 1. MANDATORY — Descriptive statistics
     # ================================================================
     def summary_statistics(self):
         """Return mean, median and standard deviation for required variables."""
-        stats = {
-            "study_hours_mean": self.df["study_hours"].mean(),
-            "study_hours_median": self.df["study_hours"].median(),
-            "study_hours_std": self.df["study_hours"].std(),
-
-            "quiz_part_mean": self.df["quiz_participation"].mean(),
-            "quiz_part_median": self.df["quiz_participation"].median(),
-            "quiz_part_std": self.df["quiz_participation"].std(),
-        }
+        stats = {}
+        for prefix, column in (("study_hours", "study_hours"), ("quiz_part", "quiz_participation")):
+            x = self._values(column)
+            stats[f"{prefix}_mean"] = x.mean()
+            stats[f"{prefix}_median"] = np.median(x)
+            stats[f"{prefix}_std"] = x.std(ddof=1)
         return pd.Series(stats)
 
     # ================================================================
     # 2. MANDATORY — Correlation matrix
     # ================================================================
-    def correlation_matrix(self):
-        numeric_df = self.df.select_dtypes(include=[np.number])
-        return numeric_df.corr()
+    def correlation_matrix(self, method="pearson"):
+        """
+        Correlation between numeric columns.
+
+        Pearson uses np.corrcoef on the dense float matrix (one BLAS pass)
+        instead of the pairwise pandas loop. Spearman and Kendall are computed
+        on the upper triangle only and mirrored, since the matrix is symmetric
+        with a unit diagonal. Rows with missing values are dropped first,
+        which is a no-op on the cleaned dataset.
+        """
+        numeric_df = self.df.select_dtypes(include=[np.number]).dropna()
+        arr = numeric_df.to_numpy(dtype=np.float64)
+        if method == "pearson":
+            corr = np.atleast_2d(np.corrcoef(arr, rowvar=False))
+        else:
+            corr = self._pairwise_correlation(arr, method)
+        return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
+    @staticmethod
+    def _pairwise_correlation(arr, method):
+        """Fill a symmetric correlation matrix from (n^2 - n) / 2 column pairs."""
+        corr_funcs = {"spearman": spearmanr, "kendall": kendalltau}
+        if method not in corr_funcs:
+            raise ValueError(f"Unsupported correlation method: {method}")
+        corr_func = corr_funcs[method]
+
+        n = arr.shape[1]
+        corr = np.empty((n, n))
+        np.fill_diagonal(corr, 1.0)
+        for i, j in combinations(range(n), 2):
+            corr[i, j] = corr[j, i] = corr_func(arr[:, i], arr[:, j])[0]
+        return corr
 
     # ================================================================
     # 3. MANDATORY — Grouped analysis
     # ================================================================
     def group_analysis(self):
         """Group by course_completion (mandatory) and compute avg engagement."""
-        return self.df.groupby("course_completion")["engagement"].mean()
+        # observed=True: no empty-group expansion if the key is categorical
+        # sort=False: hash grouping, then sort only the handful of result rows
+        return (
+            self.df.groupby("course_completion", observed=True, sort=False)["engagement"]
+            .mean()
+            .sort_index()
+        )
 
     # ================================================================
     # 4. MANDATORY — Filtering example
@@ -80,29 +132,49 @@ class DataAnalyzer:
     # ================================================================
     def classify_performance(self):
         """Classify past performance into High/Medium/Low."""
-        def classify(score):
-            if score >= 85:
-                return "High"
-            elif score >= 60:
-                return "Medium"
-            return "Low"
-
-        self.df["performance_level"] = self.df["past_performance"].apply(classify)
+        score = self.df["past_performance"]
+        # Vectorized equivalent of the if/elif chain (>=85 High, >=60 Medium, else Low)
+        self.df["performance_level"] = np.select(
+            [score >= 85, score >= 60], ["High", "Medium"], default="Low"
+        )
         return self.df[["past_performance", "performance_level"]]
 
     # ================================================================
     # 6. EXTENDED — Distribution shape (skewness, kurtosis, IQR)
     # ================================================================
     def distribution_shape(self, column="study_hours"):
-        """Extended descriptive statistics for academic analysis."""
-        data = self.df[column]
+        """
+        Extended descriptive statistics for academic analysis.
+
+        All values come from one set of central moments plus a single quantile
+        call, instead of seven separate pandas reductions. The bias corrections
+        match pandas: sample std (ddof=1), adjusted skewness and excess kurtosis.
+        """
+        x = self._values(column)
+        n = x.size
+        mean = x.mean()
+        d = x - mean
+        d2 = d * d
+        m2 = d2.mean()
+        m3 = (d2 * d).mean()
+        m4 = (d2 * d2).mean()
+
+        # A constant column has no spread; pandas reports 0.0 for both
+        if m2 == 0:
+            skewness = kurtosis = 0.0
+        else:
+            g1 = m3 / m2 ** 1.5
+            g2 = m4 / m2 ** 2 - 3
+            skewness = g1 * np.sqrt(n * (n - 1)) / (n - 2)
+            kurtosis = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+        q1, median, q3 = np.quantile(x, [0.25, 0.5, 0.75])
         return pd.Series({
-            "mean": data.mean(),
-            "median": data.median(),
-            "std": data.std(),
-            "skewness": data.skew(),
-            "kurtosis": data.kurtosis(),
-            "iqr": data.quantile(0.75) - data.quantile(0.25),
+            "mean": mean,
+            "median": median,
+            "std": np.sqrt(m2 * n / (n - 1)),
+            "skewness": skewness,
+            "kurtosis": kurtosis,
+            "iqr": q3 - q1,
         })
 
     # ================================================================
@@ -114,11 +186,11 @@ class DataAnalyzer:
         iqr = q3 - q1
         lower = q1 - multiplier * iqr
         upper = q3 + multiplier * iqr
-        mask = (data < lower) | (data > upper)
+        n_outliers = _outlier_kernel(data.to_numpy(dtype=np.float64), lower, upper)
         return {
             "lower_bound": lower,
             "upper_bound": upper,
-            "n_outliers": int(mask.sum())
+            "n_outliers": int(n_outliers)
         }
 
     # ================================================================
@@ -138,27 +210,53 @@ class DataAnalyzer:
     # 9. EXTENDED — Contingency tables (categorical cross-analysis)
     # ================================================================
     def contingency_tables(self):
-        """Produce cross-tabulations for categorical variables."""
-        tables = {}
+        """
+        Produce cross-tabulations for categorical variables.
 
-        # Correct variable names based on CSV
-        if "gender" in self.df.columns and "course_completion" in self.df.columns:
-            tables["gender_course_completion"] = pd.crosstab(
-                self.df["gender"], self.df["course_completion"], margins=True
-            )
+        course_completion is factorized once and shared by all three tables;
+        each table is then a single bincount over the combined integer codes
+        instead of a separate pd.crosstab groupby.
+        """
+        tables = {}
+        if "course_completion" not in self.df.columns:
+            return tables
 
-        if "age_bucket" in self.df.columns and "course_completion" in self.df.columns:
-            tables["age_course_completion"] = pd.crosstab(
-                self.df["age_bucket"], self.df["course_completion"], margins=True
-            )
+        col_codes, col_values = pd.factorize(self.df["course_completion"], sort=True)
+        col_index = pd.Index(col_values, name="course_completion")
 
-        if "performance_level" in self.df.columns and "course_completion" in self.df.columns:
-            tables["performance_course_completion"] = pd.crosstab(
-                self.df["performance_level"], self.df["course_completion"], margins=True
-            )
+        # Correct variable names based on CSV
+        row_vars = {
+            "gender_course_completion": "gender",
+            "age_course_completion": "age_bucket",
+            "performance_course_completion": "performance_level",
+        }
+        for name, row_var in row_vars.items():
+            if row_var in self.df.columns:
+                tables[name] = self._crosstab_codes(
+                    self.df[row_var], col_codes, col_index
+                )
 
         return tables
 
+    @staticmethod
+    def _crosstab_codes(rows, col_codes, col_index):
+        """pd.crosstab(rows, cols, margins=True) from pre-factorized column codes."""
+        row_codes, row_values = pd.factorize(rows, sort=True)
+        valid = (row_codes >= 0) & (col_codes >= 0)  # crosstab drops NaN on either side
+
+        n_rows, n_cols = len(row_values), len(col_index)
+        flat = row_codes[valid] * n_cols + col_codes[valid]
+        counts = np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+        table = pd.DataFrame(
+            counts,
+            index=pd.Index(np.asarray(row_values), name=rows.name),
+            columns=col_index,
+        )
+        table["All"] = table.sum(axis=1)
+        table.loc["All"] = table.sum(axis=0)
+        return table
+
 
 # ================================================================
 # Main execution (local testing only)
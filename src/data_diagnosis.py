@@ -12,6 +12,8 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
+from data_io import load_csv
+
 # -----------------------------
 # 1. Paths
 # -----------------------------
@@ -30,7 +32,7 @@ csv_file = DATA_DIR / "students_cleaned.csv"  # example for cleaned dataset
 # -----------------------------
 # 3. Load dataset
 # -----------------------------
-df = pd.read_csv(csv_file)
+df = load_csv(csv_file)  # reuses the Parquet sidecar if it is up to date
 
 # -----------------------------
 # 4. Basic info
@@ -44,17 +46,24 @@ print(df.dtypes)
 print("\n=== First 5 Rows ===")
 print(df.head())
 
+# One isna() scan, reused for counts and percentages
+na_per_col = df.isna().sum()
+
 print("\n=== Missing Values ===")
-print(df.isna().sum())
+print(na_per_col)
 
 print("\n=== Missing Values Percentage ===")
-print((df.isna().sum() / len(df) * 100).round(2))
+print((na_per_col / len(df) * 100).round(2))
 
 # -----------------------------
 # 5. Numeric summary
 # -----------------------------
+# Numeric sub-frame selected once and shared with section 8
+numeric_df = df.select_dtypes(include=[np.number])
+# describe() already computes the quartiles, keep it for the outlier check in section 8
+numeric_summary = numeric_df.describe()
 print("\n=== Numeric Columns Summary ===")
-print(df.describe())
+print(numeric_summary)
 
 # -----------------------------
 # 6. Unique counts
@@ -75,16 +84,19 @@ if len(bool_cols) > 0:
 # -----------------------------
 # 8. Quick outlier detection for numeric columns
 # -----------------------------
-numeric_cols = df.select_dtypes(include=[np.number]).columns
+numeric_cols = numeric_df.columns
 print("\n=== Numeric Columns Outliers (below Q1-1.5*IQR or above Q3+1.5*IQR) ===")
-for col in numeric_cols:
-    q1 = df[col].quantile(0.25)
-    q3 = df[col].quantile(0.75)
-    iqr = q3 - q1
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
-    outliers = df[(df[col] < lower) | (df[col] > upper)]
-    print(f"{col}: {len(outliers)} outliers ({(len(outliers)/len(df)*100):.2f}%)")
+# Reuse the quartiles from describe() instead of another quantile pass, then broadcast the bounds
+q1 = numeric_summary.loc['25%'].to_numpy()
+q3 = numeric_summary.loc['75%'].to_numpy()
+iqr = q3 - q1
+lower = q1 - 1.5 * iqr
+upper = q3 + 1.5 * iqr
+# One (n, k) matrix scan: compare against the (k,) bound vectors and count per column
+M = numeric_df.to_numpy(dtype=np.float64)
+outlier_counts = ((M < lower) | (M > upper)).sum(axis=0)
+for col, n_outliers in zip(numeric_cols, outlier_counts):
+    print(f"{col}: {n_outliers} outliers ({(n_outliers/len(df)*100):.2f}%)")
 
 # -----------------------------
 # 9. Quiz Participation Analysis
@@ -103,16 +115,10 @@ def diagnose_quiz_participation(df: pd.DataFrame):
         
     # Convert all values to string for consistent processing
     all_values = df[col].astype(str)
-    
-    # Check which values can't be converted to float
-    def is_number(x):
-        try:
-            float(x)
-            return True
-        except ValueError:
-            return False
-
-    non_numeric_mask = ~all_values.apply(is_number)
+
+    # Vectorized numeric check: anything that can't be parsed becomes NaN
+    numeric_series = pd.to_numeric(all_values, errors='coerce')
+    non_numeric_mask = numeric_series.isna() & df[col].notna()
     non_numeric_count = non_numeric_mask.sum()
     
     print(f"\n=== Quiz Participation Analysis ===")
@@ -126,14 +132,13 @@ def diagnose_quiz_participation(df: pd.DataFrame):
         print("All values are numeric.")
     
     # Additional stats for numeric values
-    numeric_mask = all_values.apply(is_number)
-    if numeric_mask.any():
+    numeric_values = numeric_series.dropna()
+    if not numeric_values.empty:
         print("\nNumeric values summary:")
-        numeric_series = pd.to_numeric(all_values[numeric_mask], errors='coerce')
-        print(f"  Min: {numeric_series.min():.2f}")
-        print(f"  Max: {numeric_series.max():.2f}")
-        print(f"  Mean: {numeric_series.mean():.2f}")
-        print(f"  Median: {numeric_series.median():.2f}")
+        print(f"  Min: {numeric_values.min():.2f}")
+        print(f"  Max: {numeric_values.max():.2f}")
+        print(f"  Mean: {numeric_values.mean():.2f}")
+        print(f"  Median: {numeric_values.median():.2f}")
 
 # Run the diagnosis
 diagnose_quiz_participation(df)
@@ -6,14 +6,43 @@ Generates synthetic student records with realistic distributions,
 missing values, and inconsistencies for downstream analysis.
 """
 
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import numpy as np
 from faker import Faker
-from typing import Union
+from typing import Optional, Union
+
+from data_io import save_dataset, sidecar_path
+from jit import njit
+
+__all__ = ["StudentGenerator"]
+
+
+@njit(parallel=True, cache=True)
+def _inject_outliers(values, u_high, u_low, high_rate, high_lo, high_hi, low_rate, low_lo, low_hi):
+    """
+    Replace a share of values with outliers in one pass.
+
+    Rows with u_high < high_rate get a value in [high_lo, high_hi), otherwise
+    rows with u_low < low_rate get one in [low_lo, low_hi). The outlier is the
+    same uniform rescaled to its range (uniform given the condition), so no
+    further random draws are needed.
+    """
+    high = u_high < high_rate
+    low = ~high & (u_low < low_rate)
+    return np.where(
+        high,
+        high_lo + (high_hi - high_lo) * (u_high / high_rate),
+        np.where(low, low_lo + (low_hi - low_lo) * (u_low / low_rate), values),
+    )
 
 
 class StudentGenerator:
+    NAME_POOL_SIZE = 256  # distinct first names sampled per gender (twice as many last names)
+    TEXT_COLUMNS = ("student_id", "first_name", "last_name", "email")
+    GENDERS = ("Male", "Female")
+
     def __init__(self, n_students: int = 500, seed: int = 123, locale: str = "en_IE") -> None:
         """
         Initialize the StudentGenerator.
@@ -28,14 +57,22 @@ class StudentGenerator:
         self.fake = Faker(locale)
 
         # Set random seeds for reproducibility
-        np.random.seed(self.seed)
+        # One PCG64 Generator for all NumPy draws (instead of the legacy global state)
+        self.rng = np.random.default_rng(self.seed)
         Faker.seed(self.seed)
 
+        # Name pools: Faker is sampled once here and generate_dataset() draws
+        # from these arrays, instead of 2 Faker calls per student
+        self._male_pool = np.array([self.fake.first_name_male() for _ in range(self.NAME_POOL_SIZE)])
+        self._female_pool = np.array([self.fake.first_name_female() for _ in range(self.NAME_POOL_SIZE)])
+        self._last_pool = np.array([self.fake.last_name() for _ in range(2 * self.NAME_POOL_SIZE)])
+
         # Paths
         self.BASE_DIR = Path(__file__).resolve().parent.parent
         self.DATA_DIR = self.BASE_DIR / "data"
         self.DATA_DIR.mkdir(exist_ok=True)
         self.CSV_PATH = self.DATA_DIR / "students_raw.csv"
+        self.PARQUET_PATH = sidecar_path(self.CSV_PATH)  # what generate_dataset() writes
 
     # -----------------------------
     # 1. Initialization Utilities
@@ -46,8 +83,9 @@ class StudentGenerator:
         return f"S{idx:03d}"
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def generate_email(idx: Union[int, str]) -> str:
-        """Generate student email based on student number (handles int or string IDs)."""
+        """Generate student email based on student number (handles int or string IDs, memoized)."""
         # Extract number from ID, e.g., 'S001' → 1
         try:
             num = int(''.join(filter(str.isdigit, str(idx))))
@@ -56,9 +94,33 @@ class StudentGenerator:
         return f"x{num:03d}@student.ncirl.ie"
 
     @staticmethod
-    def generate_gender() -> str:
-        """Generate student gender with 50/50 probability."""
-        return np.random.choice(["Male", "Female"])
+    def generate_emails(ids: pd.Series) -> pd.Series:
+        """Vectorized generate_email() for a whole Series of student IDs."""
+        nums = pd.to_numeric(
+            ids.astype(str).str.replace(r'\D', '', regex=True), errors='coerce'
+        ).fillna(0).astype('int64')
+        return 'x' + nums.astype(str).str.zfill(3) + '@student.ncirl.ie'
+
+    @staticmethod
+    def generate_ids_and_emails(n: int, start: int = 1):
+        """Vectorized student IDs and emails for students start..start+n-1 (same format as the scalar versions)."""
+        if n == 0:
+            # np.char.zfill cannot size an empty string array
+            return np.array([], dtype=str), np.array([], dtype=str)
+        digits = np.char.zfill(np.arange(start, start + n).astype(str), 3)
+        ids = np.char.add("S", digits)
+        emails = np.char.add(np.char.add("x", digits), "@student.ncirl.ie")
+        return ids, emails
+
+    @staticmethod
+    def _scalar_or_array(values: np.ndarray, size: Optional[int]):
+        """Return the whole array when size is given, else its single value (NumPy convention)."""
+        return values if size is not None else values[0].item()
+
+    def generate_gender(self, size: Optional[int] = None):
+        """Generate student gender with 50/50 probability (array of `size` values if given)."""
+        genders = self.rng.choice(self.GENDERS, size=1 if size is None else size)
+        return self._scalar_or_array(genders, size)
 
     def generate_first_name(self, gender: str) -> str:
         """Generate first name based on gender."""
@@ -68,93 +130,102 @@ class StudentGenerator:
         """Generate last name."""
         return self.fake.last_name()
 
+    def generate_names(self, gender: np.ndarray):
+        """Vectorized first/last names for an array of genders, drawn from the Faker name pools."""
+        n = len(gender)
+        first = np.where(
+            gender == "Male",
+            self.rng.choice(self._male_pool, n),
+            self.rng.choice(self._female_pool, n),
+        )
+        last = self.rng.choice(self._last_pool, n)
+        return first, last
+
     # -----------------------------
     # 2. Academic Data
     # -----------------------------
-    @staticmethod
-    def generate_age() -> int:
+    # Each generator draws a whole column in one vectorized call when `size`
+    # is given; without it a single scalar is returned as before.
+    def generate_age(self, size: Optional[int] = None):
         """Generate student age, majority 20-24, few outliers."""
-        age = int(np.random.normal(loc=22, scale=3))
-        if age < 20 and np.random.rand() < 0.05:
-            return 19
-        if age > 45 and np.random.rand() < 0.01:
-            return np.random.randint(46, 51)
-        return max(20, min(age, 45))
-
-    @staticmethod
-    def generate_study_hours() -> float:
+        n = 1 if size is None else size
+        age = self.rng.normal(loc=22, scale=3, size=n).astype(int)  # truncates like int()
+        r = self.rng.random(n)
+        ages = np.clip(age, 20, 45)
+        ages[(age < 20) & (r < 0.05)] = 19
+        old = (age > 45) & (r < 0.01)
+        ages[old] = self.rng.integers(46, 51, size=old.sum())
+        return self._scalar_or_array(ages, size)
+
+    def generate_study_hours(self, size: Optional[int] = None):
         """Generate weekly study hours, with rare outliers."""
-        hours = np.random.triangular(left=0, mode=10, right=20)
-        r = np.random.rand()
-        if r < 0.03:
-            return np.random.uniform(100, 120)
-        if r < 0.05:
-            return np.random.uniform(-5, 0)
-        return round(hours, 2)
-
-    @staticmethod
-    def generate_quiz_participation() -> float:
+        n = 1 if size is None else size
+        hours = np.round(self.rng.triangular(left=0, mode=10, right=20, size=n), 2)
+        # One draw: r < 0.03 → 100-120 h, 0.03 <= r < 0.05 → negative
+        r = self.rng.random(n)
+        hours = _inject_outliers(hours, r, r - 0.03, 0.03, 100.0, 120.0, 0.02, -5.0, 0.0)
+        return self._scalar_or_array(hours, size)
+
+    def generate_quiz_participation(self, size: Optional[int] = None):
         """Generate quiz participation percentage, allow rare anomalies."""
-        r = np.random.rand()
-        if r < 0.03:
-            return np.random.uniform(101, 120)
-        if r < 0.05:
-            return np.random.uniform(-10, 0)
-        return round(np.random.uniform(50, 100), 1)
-
-    @staticmethod
-    def generate_past_performance() -> int:
+        n = 1 if size is None else size
+        quiz = np.round(self.rng.uniform(50, 100, size=n), 1)
+        # One draw: r < 0.03 → above 100%, 0.03 <= r < 0.05 → negative
+        r = self.rng.random(n)
+        quiz = _inject_outliers(quiz, r, r - 0.03, 0.03, 101.0, 120.0, 0.02, -10.0, 0.0)
+        return self._scalar_or_array(quiz, size)
+
+    def generate_past_performance(self, size: Optional[int] = None):
         """Generate past performance score (0-100%) with rare outliers."""
-        score = np.random.normal(loc=70, scale=15)
-        if np.random.rand() < 0.03:
-            return int(np.random.uniform(101, 120))
-        if np.random.rand() < 0.02:
-            return int(np.random.uniform(-10, 0))
-        return int(np.clip(score, 0, 100))
-
-    @staticmethod
-    def generate_course_completed() -> bool:
+        n = 1 if size is None else size
+        scores = np.clip(self.rng.normal(loc=70, scale=15, size=n), 0, 100)
+        # Two independent draws: 3% above 100, then 2% of the rest negative
+        u = self.rng.random((2, n))
+        scores = _inject_outliers(scores, u[0], u[1], 0.03, 101.0, 120.0, 0.02, -10.0, 0.0)
+        return self._scalar_or_array(scores.astype(int), size)  # truncates like int()
+
+    def generate_course_completed(self, size: Optional[int] = None):
         """Generate course completion (70% True, 30% False)."""
-        return np.random.choice([True, False], p=[0.7, 0.3])
+        completed = self.rng.random(1 if size is None else size) < 0.7
+        return self._scalar_or_array(completed, size)
 
     # -----------------------------
     # 3. Data Contamination
     # -----------------------------
+    # These methods modify df in place and return it for chaining; no
+    # intermediate frame copies. Pass df.copy() to keep the original.
     def introduce_nan_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Introduce missing values strategically across columns.
 
         Args:
-            df (pd.DataFrame): Input DataFrame
+            df (pd.DataFrame): Input DataFrame, modified in place
 
         Returns:
-            pd.DataFrame: DataFrame with NaN values introduced
+            pd.DataFrame: The same DataFrame, with NaN values introduced
         """
-        df = df.copy()
-
         # Ensure appropriate nullable dtypes
         df['study_hours'] = df['study_hours'].astype('float64')
         df['quiz_participation'] = df['quiz_participation'].astype('float64')
         df['past_performance'] = df['past_performance'].astype('float64')
         df['course_completion'] = df['course_completion'].astype('boolean')
 
-        # -----------------------------
-        # Numeric columns
-        # -----------------------------
-        df.loc[np.random.rand(len(df)) < 0.07, 'study_hours'] = np.nan  # 7% missing
-        df.loc[np.random.rand(len(df)) < 0.06, 'quiz_participation'] = np.nan
-        df.loc[np.random.rand(len(df)) < 0.05, 'past_performance'] = np.nan
-
-        # Boolean column
-        df.loc[np.random.rand(len(df)) < 0.03, 'course_completion'] = pd.NA
-
-        # -----------------------------
-        # String / categorical columns
-        # -----------------------------
-        df.loc[np.random.rand(len(df)) < 0.01, 'first_name'] = None
-        df.loc[np.random.rand(len(df)) < 0.01, 'last_name'] = None
-        df.loc[np.random.rand(len(df)) < 0.005, 'gender'] = None
-        df.loc[np.random.rand(len(df)) < 0.005, 'email'] = None
+        # Missing-value rate per column: numeric, boolean, then string columns
+        nan_rates = {
+            'study_hours': 0.07,  # 7% missing
+            'quiz_participation': 0.06,
+            'past_performance': 0.05,
+            'course_completion': 0.03,
+            'first_name': 0.01,
+            'last_name': 0.01,
+            'gender': 0.005,
+            'email': 0.005,
+        }
+        # One uniform draw for all columns; Series.mask() writes the
+        # dtype's own missing marker (NaN / pd.NA) without .loc lookups
+        u = self.rng.random((len(df), len(nan_rates)))
+        for j, (col, rate) in enumerate(nan_rates.items()):
+            df[col] = df[col].mask(u[:, j] < rate)
 
         return df
 
@@ -163,34 +234,39 @@ class StudentGenerator:
         Introduce value inconsistencies to simulate real-world messy data.
 
         Args:
-            df (pd.DataFrame)
+            df (pd.DataFrame): Modified in place
 
         Returns:
-            pd.DataFrame
+            pd.DataFrame: The same DataFrame
         """
-        df = df.copy()
+        # Columns that receive text or fractional values need a dtype that can
+        # hold them (pandas refuses to upcast int/float columns implicitly)
+        for col, dtype in (('age', object), ('study_hours', object),
+                           ('past_performance', 'float64'), ('quiz_participation', object)):
+            df[col] = df[col].astype(dtype)
 
         # Age inconsistencies
-        df.loc[np.random.rand(len(df)) < 0.02, 'age'] = 'unknown'
+        df.loc[self.rng.random(len(df)) < 0.02, 'age'] = 'unknown'
 
         # Study hours inconsistencies
-        df.loc[np.random.rand(len(df)) < 0.02, 'study_hours'] = 'various'
+        df.loc[self.rng.random(len(df)) < 0.02, 'study_hours'] = 'various'
 
         # Past performance as fraction
-        mask = np.random.rand(len(df)) < 0.02
+        mask = self.rng.random(len(df)) < 0.02
         df.loc[mask, 'past_performance'] = df.loc[mask, 'past_performance'] / 100
 
-        # Quiz participation different formats
-        def alter_quiz(x):
-            choice = np.random.choice(['fraction', 'percent_sign', 'decimal'])
-            if choice == 'fraction':
-                return f"{x}%"
-            elif choice == 'percent_sign':
-                return x / 100
-            return round(x / 100, 2)
-
-        mask = np.random.rand(len(df)) < 0.03
-        df.loc[mask, 'quiz_participation'] = df.loc[mask, 'quiz_participation'].apply(alter_quiz)
+        # Quiz participation different formats: "72.5%", 0.725 or 0.73,
+        # chosen per row and built on the whole masked array at once
+        mask = self.rng.random(len(df)) < 0.03
+        quiz = df.loc[mask, 'quiz_participation'].to_numpy(dtype=np.float64)
+        choice = self.rng.integers(0, 3, size=quiz.size)
+        # object choices so the float branches are not coerced to strings
+        altered = np.select(
+            [choice == 0, choice == 1],
+            [np.char.add(quiz.astype(str), '%').astype(object), (quiz / 100).astype(object)],
+            default=np.round(quiz / 100, 2).astype(object),
+        )
+        df.loc[mask, 'quiz_participation'] = altered
 
         return df
 
@@ -199,19 +275,25 @@ class StudentGenerator:
         Introduce boolean inconsistencies in course_completion.
 
         Args:
-            df (pd.DataFrame)
+            df (pd.DataFrame): Modified in place
 
         Returns:
-            pd.DataFrame
+            pd.DataFrame: The same DataFrame
         """
-        df = df.copy()
-        bool_mask = np.random.rand(len(df)) < 0.04
-
-        for idx in df[bool_mask].index:
-            if df.loc[idx, 'course_completion'] is True:
-                df.loc[idx, 'course_completion'] = np.random.choice(['Yes', '1', 'Completed', 'TRUE'])
-            else:
-                df.loc[idx, 'course_completion'] = np.random.choice(['No', '0', 'Incomplete', 'FALSE'])
+        bool_mask = self.rng.random(len(df)) < 0.04
+        # Missing values count as not completed, as before
+        is_true = df['course_completion'].fillna(False).to_numpy(dtype=bool)
+        true_rows = bool_mask & is_true
+        false_rows = bool_mask & ~is_true
+
+        # object column so the text variants can be stored next to booleans
+        df['course_completion'] = df['course_completion'].astype(object)
+        df.loc[true_rows, 'course_completion'] = self.rng.choice(
+            ['Yes', '1', 'Completed', 'TRUE'], size=true_rows.sum()
+        )
+        df.loc[false_rows, 'course_completion'] = self.rng.choice(
+            ['No', '0', 'Incomplete', 'FALSE'], size=false_rows.sum()
+        )
 
         return df
 
@@ -248,29 +330,98 @@ class StudentGenerator:
     # -----------------------------
     # 5. Generate full dataset
     # -----------------------------
-    def generate_dataset(self, add_nan: bool = True) -> pd.DataFrame:
+    def generate_dataset(self, add_nan: bool = True, write_csv: bool = False) -> pd.DataFrame:
         """
-        Generate and save the full dataset.
+        Generate and save the full dataset (as Parquet, see PARQUET_PATH).
+
+        DataCleaner(CSV_PATH) still works: load_csv() resolves to the Parquet file.
 
         Args:
             add_nan (bool): Add NaN values or not
+            write_csv (bool): Also write the plain CSV to CSV_PATH
 
         Returns:
             pd.DataFrame
         """
         print(f"Generating {self.n_students} student records...")
-        records = [self.generate_student_record(i + 1) for i in range(self.n_students)]
-        df = pd.DataFrame(records)
-
         if add_nan:
             print("Introducing missing values...")
-            df = self.introduce_nan_values(df)
+        df = self._generate_chunk(0, self.n_students, add_nan)
 
-        df.to_csv(self.CSV_PATH, index=False)
-        print(f"Dataset saved to: {self.CSV_PATH}")
+        # zstd Parquet: typed columns, no text reparsing on the next load
+        save_dataset(df, self.CSV_PATH, write_csv=write_csv)
+        print(f"Dataset saved to: {self.PARQUET_PATH}")
         print(f"Sample data:\n{df.head()}")
         return df
 
+    def generate_dataset_chunked(self, chunk_size: int = 100_000, add_nan: bool = True,
+                                 output_path: Optional[Path] = None) -> Path:
+        """
+        Generate the dataset in chunks, streaming each one to a Parquet file.
+
+        Only one chunk is held in memory at a time, so peak memory depends on
+        chunk_size rather than n_students. Nothing is returned but the path;
+        load it with data_io.load_csv / pd.read_parquet.
+
+        Args:
+            chunk_size (int): Students generated and written per chunk
+            add_nan (bool): Add NaN values or not
+            output_path (Path): Target file (default: PARQUET_PATH)
+
+        Returns:
+            Path: Path of the written Parquet file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output_path = Path(output_path or self.PARQUET_PATH)
+        print(f"Generating {self.n_students} student records in chunks of {chunk_size}...")
+        writer = None
+        try:
+            # At least one (possibly empty) chunk, so n_students=0 still writes
+            # a file with the full schema
+            for start in range(0, max(self.n_students, 1), chunk_size):
+                chunk = self._generate_chunk(start, min(chunk_size, self.n_students - start), add_nan)
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema, compression="zstd")
+                writer.write_table(table)
+                del chunk, table
+        finally:
+            if writer is not None:
+                writer.close()
+        print(f"Dataset saved to: {output_path}")
+        return output_path
+
+    def _generate_chunk(self, start: int, n: int, add_nan: bool) -> pd.DataFrame:
+        """Generate students start+1..start+n as one DataFrame (shared by both generate_dataset variants)."""
+        # Column-wise generation: one vectorized draw per numeric column
+        # instead of n calls to generate_student_record(). The arrays already
+        # have their final dtypes (int64/float64/bool), so pandas adopts them
+        # without per-value inference or an extra copy
+        gender = self.generate_gender(n)
+        first_names, last_names = self.generate_names(gender)
+        student_ids, emails = self.generate_ids_and_emails(n, start=start + 1)
+        df = pd.DataFrame({
+            "student_id": student_ids,
+            "first_name": first_names,
+            "last_name": last_names,
+            # 2 distinct values: int8 codes + one shared dictionary (kept by Parquet)
+            "gender": pd.Categorical(gender, categories=self.GENDERS),
+            "email": emails,
+            "age": self.generate_age(n),
+            "study_hours": self.generate_study_hours(n),
+            "quiz_participation": self.generate_quiz_participation(n),
+            "past_performance": self.generate_past_performance(n),
+            "course_completion": self.generate_course_completed(n),
+        }, copy=False)
+        # Arrow-backed strings (offsets + one byte buffer) instead of object arrays
+        df = df.astype({col: "string[pyarrow]" for col in self.TEXT_COLUMNS})
+
+        if add_nan:
+            df = self.introduce_nan_values(df)
+        return df
+
 
 # -----------------------------
 # Main execution
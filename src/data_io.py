@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Data I/O Helpers
+
+Shared loading/saving utilities for the student dataset.
+CSV files are parsed once and cached in a Parquet sidecar next to them,
+so repeated loads (cleaning, analysis, diagnosis) skip text parsing and
+dtype inference. Datasets can also be saved straight to that sidecar,
+which keeps dtypes (category, bool) that a CSV round-trip would lose.
+"""
+
+from pathlib import Path
+import pandas as pd
+import pyarrow.parquet as pq
+
+
+# -----------------------------
+# 1. Cached CSV loading
+# -----------------------------
+def sidecar_path(csv_path) -> Path:
+    """Return the Parquet sidecar path for a CSV file (same name, .parquet suffix)."""
+    return Path(csv_path).with_suffix('.parquet')
+
+
+def load_csv(csv_path, dtype: dict = None, columns: list = None) -> pd.DataFrame:
+    """
+    Load a CSV file, using a Parquet sidecar as a cache.
+
+    If the sidecar exists and is newer than the CSV (or the CSV was never
+    written, see save_dataset) it is read instead. Otherwise the CSV is
+    parsed with the pyarrow engine and the sidecar is (re)written.
+    A .parquet path is its own sidecar, so it is read directly.
+
+    Args:
+        csv_path (str | Path): Path to the CSV (or Parquet) file
+        dtype (dict): Optional {column: dtype} casts applied after loading.
+            Columns missing from the file are ignored; the sidecar always
+            keeps the full-precision data.
+        columns (list): Optional subset of columns to return (absent ones are
+            ignored). Only these are read from the sidecar; a CSV is still
+            parsed in full so the sidecar stays complete.
+
+    Returns:
+        pd.DataFrame
+    """
+    csv_path = Path(csv_path)
+    sidecar = sidecar_path(csv_path)
+
+    if sidecar.exists() and (
+        not csv_path.exists() or sidecar.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        if columns is not None:
+            # Parquet is columnar: only the requested column chunks are read
+            available = set(pq.read_schema(sidecar).names)
+            columns = [col for col in columns if col in available]
+        return _cast(pd.read_parquet(sidecar, columns=columns), dtype)
+
+    # Arrow's multithreaded CSV reader; NumPy-backed dtypes are kept for downstream code
+    df = pd.read_csv(csv_path, engine='pyarrow')
+    try:
+        df.to_parquet(sidecar, compression='zstd', index=False)
+    except (ImportError, OSError, ValueError, TypeError):
+        # Cache is best-effort: no parquet engine, read-only directory
+        # or a column Arrow cannot store. Never leave a partial sidecar behind.
+        sidecar.unlink(missing_ok=True)
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    return _cast(df, dtype)
+
+
+def _cast(df: pd.DataFrame, dtype: dict = None) -> pd.DataFrame:
+    """Apply the dtype map of load_csv() to the columns that exist."""
+    if not dtype:
+        return df
+    return df.astype({col: t for col, t in dtype.items() if col in df.columns})
+
+
+# -----------------------------
+# 2. Saving
+# -----------------------------
+def save_dataset(df: pd.DataFrame, csv_path, write_csv: bool = False) -> Path:
+    """
+    Save a dataset as Parquet (the sidecar of csv_path), optionally also as CSV.
+
+    The CSV is written first so the Parquet file is the newer of the two
+    and load_csv() picks it up.
+
+    Args:
+        df (pd.DataFrame): Data to save
+        csv_path (str | Path): Nominal CSV path; the Parquet file sits next to it
+        write_csv (bool): Also write the CSV (for tools that need plain text)
+
+    Returns:
+        Path: Path of the written Parquet file
+    """
+    parquet_path = sidecar_path(csv_path)
+    if write_csv:
+        df.to_csv(csv_path, index=False)
+    df.to_parquet(parquet_path, compression='zstd', index=False)
+    return parquet_path
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+JIT Helpers
+
+Optional Numba acceleration for the numeric kernels used across the project.
+If numba is not installed, `njit` becomes a no-op decorator and the kernels
+run as plain vectorized NumPy, so results are identical either way.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (works as @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
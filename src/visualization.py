@@ -17,30 +17,129 @@ Extended:
 
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import seaborn as sns
+from scipy.stats import gaussian_kde
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
 
+from data_io import load_csv
+from jit import NUMBA_AVAILABLE, njit
+
+# Largest sample a KDE overlay is fitted on (bigger columns are subsampled)
+KDE_MAX_POINTS = 50_000
+# No KDE overlay for essentially discrete columns (fewer distinct values than
+# this) or very large ones, where the curve adds nothing to the bars
+KDE_MIN_UNIQUE = 20
+KDE_MAX_ROWS = 5_000_000
+# Colour palettes resolved once at import instead of per figure
+PALETTES = {
+    "Set1": sns.color_palette("Set1"),
+    "Set3": sns.color_palette("Set3"),
+    "pastel": sns.color_palette("pastel"),
+}
+
+
+@njit(cache=True)
+def _hist_kernel(x, edges):
+    """
+    Counts of x in equal-width bins given by edges (last bin closed, values
+    outside ignored), in one pass with no temporaries. The bin index is
+    corrected against the edges exactly as np.histogram does.
+
+    Serial on purpose: figures are already rendered in parallel threads
+    (see main), and launching numba parallel regions from several Python
+    threads can hang the TBB threading layer at interpreter exit.
+    """
+    nbins = edges.size - 1
+    lo, hi = edges[0], edges[-1]
+    inv = nbins / (hi - lo)
+    out = np.zeros(nbins, np.int64)
+    for i in range(x.size):
+        v = x[i]
+        if v >= lo and v <= hi:
+            b = min(int((v - lo) * inv), nbins - 1)
+            if v < edges[b]:
+                b -= 1
+            elif b < nbins - 1 and v >= edges[b + 1]:
+                b += 1
+            out[b] += 1
+    return out
+
+
+def _histogram(values, bins: int):
+    """np.histogram(values, bins) for NaN-free values, counted by the JIT kernel when numba is available."""
+    if not NUMBA_AVAILABLE:
+        # The loop kernel would run as plain Python; NumPy's binning is faster
+        return np.histogram(values, bins=bins)
+    edges = np.histogram_bin_edges(values, bins=bins)
+    return _hist_kernel(values, edges), edges
+
+
 class DataVisualizer:
-    def __init__(self, csv_path: str):
+    # Only the columns the plots use are loaded (names, email, age etc. are never read).
+    # Plotted measures only need float32 precision (halves memory for binning/drawing);
+    # grouping/hue columns are categorical once here, so groupby/crosstab/colour
+    # lookups below work on small integer codes
+    PLOT_DTYPES = {
+        "study_hours": "float32",
+        "quiz_participation": "float32",
+        "past_performance": "float32",
+        "engagement": "float32",
+        "course_completion": "category",
+        "gender": "category",
+        "age_bucket": "category",
+        "performance_level": "category",
+    }
+
+    # Measures plotted by the histogram / boxplot methods
+    NUMERIC_COLS = ("study_hours", "quiz_participation", "past_performance", "engagement")
+
+    # savefig settings per output quality: "fast" for exploratory runs
+    # (lower dpi, zlib level 1 instead of the slower default deflate),
+    # "final" for report figures
+    SAVE_PRESETS = {
+        "fast": {"dpi": 150, "pil_kwargs": {"compress_level": 1, "optimize": False}},
+        "final": {"dpi": 300},
+    }
+
+    def __init__(self, csv_path: str, quality: str = "fast"):
         self.csv_path = csv_path
-        self.df = pd.read_csv(csv_path)
+        # Default save_figure quality for every plot of this visualizer
+        self.quality = quality
+        # Picks up the Parquet written by DataCleaner; a plain CSV is parsed
+        # with pyarrow's multithreaded reader (see data_io.load_csv)
+        self.df = load_csv(csv_path, dtype=self.PLOT_DTYPES, columns=list(self.PLOT_DTYPES))
+        # float32 arrays of the numeric columns, converted once and shared by all plots
+        self._num = {c: self.df[c].to_numpy(dtype=np.float32, copy=False)
+                     for c in self.NUMERIC_COLS if c in self.df.columns}
         # Create reports/figures directory if it doesn't exist
         self.figures_dir = Path(__file__).resolve().parent.parent / 'reports' / 'figures'
         self.figures_dir.mkdir(parents=True, exist_ok=True)
         
-    def save_figure(self, fig, filename: str):
+    def save_figure(self, fig, filename: str, quality: str = None):
         """
         Save the given figure to the reports/figures directory.
         
         Args:
             fig: Matplotlib figure object to save
             filename: Name of the file (without extension)
+            quality: "fast" or "final" (see SAVE_PRESETS); defaults to self.quality
             
         Returns:
             str: Full path to the saved figure
         """
+        quality = quality or self.quality
+        if quality not in self.SAVE_PRESETS:
+            raise ValueError(f"Unsupported figure quality: {quality}")
+
         # Ensure the filename ends with .png
         if not filename.endswith('.png'):
             filename += '.png'
@@ -48,11 +147,76 @@ class DataVisualizer:
         # Create the full path
         filepath = self.figures_dir / filename
         
-        # Save the figure
-        fig.savefig(filepath, dpi=300, bbox_inches='tight')
+        # Save the figure (layout is finalised here, on the Figure itself)
+        fig.tight_layout()
+        fig.savefig(filepath, bbox_inches='tight', **self.SAVE_PRESETS[quality])
         print(f"Figure saved to: {filepath}")
         return str(filepath)
 
+    @staticmethod
+    def _subplots(figsize, show: bool):
+        """
+        Create a figure with a single axes.
+
+        Figures that are only saved are built as a plain Figure on its own Agg
+        canvas, outside pyplot's global figure registry, so each plotting
+        method can run in its own thread (see main). Only figures that will
+        be shown go through pyplot.
+        """
+        if show:
+            return plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.add_subplot(1, 1, 1)
+
+    @staticmethod
+    def _close(fig, show: bool):
+        """
+        Release a figure created by _subplots. Only shown figures are registered
+        with pyplot; a detached Figure is simply garbage-collected, so worker
+        threads never touch pyplot's global state.
+        """
+        if show:
+            plt.close(fig)
+
+    @staticmethod
+    def _hist_with_kde(ax, values, bins: int = 20, color: str = "skyblue", kde: bool = True,
+                       **bar_kwargs):
+        """
+        Draw a histogram of a 1-D array, optionally with a KDE curve scaled to counts.
+
+        Bins are counted once (see _histogram) and drawn as bars (what ax.hist does,
+        without its per-call input handling). The KDE is fitted once and
+        evaluated on a 200-point grid; above KDE_MAX_POINTS values it is fitted
+        on a fixed random subsample. The KDE is skipped for low-cardinality
+        (fewer than KDE_MIN_UNIQUE distinct values) or very large columns.
+
+        Args:
+            ax: Matplotlib axes to draw on
+            values: Data without NaNs
+            bins: Number of bins
+            color: Bar / curve colour
+            kde: Overlay the KDE curve
+            **bar_kwargs: Extra ax.bar styling (edgecolor, alpha, ...)
+
+        Returns:
+            tuple: (counts, edges)
+        """
+        values = np.asarray(values)
+        counts, edges = _histogram(values, bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", color=color, **bar_kwargs)
+        if kde and values.size <= KDE_MAX_ROWS:
+            sample = values
+            if values.size > KDE_MAX_POINTS:
+                sample = np.random.default_rng(0).choice(values, KDE_MAX_POINTS, replace=False)
+            # Cardinality checked on the (sub)sample: it never has more distinct values than the column
+            if np.unique(sample).size < KDE_MIN_UNIQUE:
+                return counts, edges
+            xs = np.linspace(edges[0], edges[-1], 200)
+            # Density scaled to counts so it overlays the bars (as seaborn's kde=True)
+            ax.plot(xs, gaussian_kde(sample)(xs) * values.size * (edges[1] - edges[0]), color=color)
+        return counts, edges
+
     # ================================================================
     # 1. Scatter plot: study_hours vs past_performance
     # ================================================================
@@ -64,54 +228,56 @@ class DataVisualizer:
             save_fig: Whether to save the figure to a file
             show: Whether to display the figure
         """
-        fig, ax = plt.subplots(figsize=(8,6))
-        sns.scatterplot(
-            data=self.df,
-            x="study_hours",
-            y="past_performance",
-            hue="course_completion",
-            style="course_completion",
-            palette="Set1",
-            s=60,
-            ax=ax
-        )
+        fig, ax = self._subplots((8,6), show)
+        # One PathCollection for all points: hue as integer category codes,
+        # coloured from the first Set1 colours (one per category)
+        x = self._num["study_hours"]
+        y = self._num["past_performance"]
+        cats = self.df["course_completion"].astype("category")
+        codes = cats.cat.codes.to_numpy()
+        cmap = ListedColormap(PALETTES["Set1"][:len(cats.cat.categories)])
+        sc = ax.scatter(x, y, c=codes, cmap=cmap, vmin=0, vmax=max(len(cats.cat.categories) - 1, 1),
+                        s=60, edgecolors="white", linewidths=0.5)
         ax.set_title("Study Hours vs Past Performance")
         ax.set_xlabel("Study Hours")
         ax.set_ylabel("Past Performance (%)")
-        ax.legend(title="Course Completed")
+        ax.legend(handles=sc.legend_elements()[0], labels=[str(c) for c in cats.cat.categories],
+                  title="Course Completed")
         ax.grid(True)
-        plt.tight_layout()
         
         if save_fig:
             self.save_figure(fig, "study_vs_performance.png")
         if show:
             plt.show()
-        plt.close(fig)
+        self._close(fig, show)
 
     # ================================================================
     # 2. Histogram: quiz_participation
     # ================================================================
-    def histogram_quiz_participation(self, save_fig: bool = True, show: bool = True):
+    def histogram_quiz_participation(self, save_fig: bool = True, show: bool = True,
+                                     kde: bool = False):
         """
         Create a histogram of quiz participation.
         
         Args:
             save_fig: Whether to save the figure to a file
             show: Whether to display the figure
+            kde: Overlay a Gaussian KDE curve (extra scipy fit, off by default)
         """
-        fig, ax = plt.subplots(figsize=(8,6))
-        sns.histplot(self.df["quiz_participation"], bins=20, kde=True, color="skyblue", ax=ax)
+        fig, ax = self._subplots((8,6), show)
+        values = self._num["quiz_participation"]
+        values = values[~np.isnan(values)]
+        self._hist_with_kde(ax, values, color="skyblue", kde=kde, edgecolor="white", alpha=0.8)
         ax.set_title("Distribution of Quiz Participation")
         ax.set_xlabel("Quiz Participation (%)")
         ax.set_ylabel("Count")
-        ax.grid(axis="y")
-        plt.tight_layout()
+        ax.grid(True, axis="y")
         
         if save_fig:
             self.save_figure(fig, "quiz_participation_histogram.png")
         if show:
             plt.show()
-        plt.close(fig)
+        self._close(fig, show)
 
     # ================================================================
     # 3. Bar chart: average engagement by course_completion
@@ -124,26 +290,31 @@ class DataVisualizer:
             save_fig: Whether to save the figure to a file
             show: Whether to display the figure
         """
-        fig, ax = plt.subplots(figsize=(6,5))
-        mean_engagement = self.df.groupby("course_completion")["engagement"].mean().reset_index()
-        sns.barplot(
-            data=mean_engagement,
-            x="course_completion",
-            y="engagement",
-            palette="pastel",
-            ax=ax
-        )
+        fig, ax = self._subplots((6,5), show)
+        # Per-group mean as two bincount reductions over the category codes
+        # (rows with a missing key or engagement are skipped, as in groupby.mean)
+        cats = self.df["course_completion"].astype("category")
+        codes = cats.cat.codes.to_numpy()
+        engagement = self._num["engagement"]
+        valid = (codes >= 0) & ~np.isnan(engagement)
+        k = len(cats.cat.categories)
+        sums = np.bincount(codes[valid], weights=engagement[valid], minlength=k)
+        n = np.bincount(codes[valid], minlength=k)
+        observed = n > 0
+        means = sums[observed] / n[observed]
+        labels = [str(c) for c, seen in zip(cats.cat.categories, observed) if seen]
+        ax.bar(np.arange(len(means)), means, tick_label=labels,
+               color=PALETTES["pastel"][:len(means)])
         ax.set_title("Average Engagement by Course Completion")
         ax.set_xlabel("Course Completed")
         ax.set_ylabel("Average Engagement")
         ax.set_ylim(0,1)
-        plt.tight_layout()
         
         if save_fig:
             self.save_figure(fig, "engagement_by_completion.png")
         if show:
             plt.show()
-        plt.close(fig)
+        self._close(fig, show)
 
     # ================================================================
     # 4. Boxplots with outliers for numeric variables
@@ -156,146 +327,237 @@ class DataVisualizer:
             save_fig: Whether to save the figure to a file
             show: Whether to display the figure
         """
-        numeric_cols = ["study_hours", "quiz_participation", "past_performance", "engagement"]
-        fig, ax = plt.subplots(figsize=(10,6))
-        sns.boxplot(data=self.df[numeric_cols], palette="Set3", ax=ax)
+        fig, ax = self._subplots((10,6), show)
+        # Box statistics for all columns at once, drawn with ax.bxp
+        numeric_cols = [c for c in self.NUMERIC_COLS if c in self._num]
+        M = np.column_stack([self._num[c] for c in numeric_cols])  # (n, k) float32
+        line = {"color": "dimgray"}
+        bp = ax.bxp(self._boxplot_stats(M, numeric_cols), patch_artist=True, widths=0.8,
+                    boxprops={"edgecolor": "dimgray"}, medianprops=line, whiskerprops=line,
+                    capprops=line, flierprops={"markeredgecolor": "dimgray"})
+        for box, color in zip(bp["boxes"], PALETTES["Set3"]):
+            box.set_facecolor(color)
         ax.set_title("Boxplots of Numeric Variables (outliers included)")
         ax.set_ylabel("Values")
-        plt.xticks(rotation=15)
-        plt.tight_layout()
+        ax.tick_params(axis="x", labelrotation=15)
         
         if save_fig:
             self.save_figure(fig, "numeric_boxplots.png")
         if show:
             plt.show()
-        plt.close(fig)
+        self._close(fig, show)
+
+    @staticmethod
+    def _boxplot_stats(M, labels):
+        """
+        Tukey box statistics (whiskers at 1.5 IQR) for each column of a 2-D
+        array, NaNs ignored - the same values ax.boxplot computes per column.
+
+        Quartiles come from one np.nanquantile call over all columns; the
+        whisker ends and fliers from one pass of masks on the same matrix.
+
+        Returns:
+            list: One ax.bxp stats dict per column
+        """
+        q1, med, q3 = np.nanquantile(M, [0.25, 0.5, 0.75], axis=0)
+        iqr = q3 - q1
+        lo, hi = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        inside = (M >= lo) & (M <= hi)  # NaN compares False
+        outside = (M < lo) | (M > hi)
+        whislo = np.where(inside, M, np.inf).min(axis=0)
+        whishi = np.where(inside, M, -np.inf).max(axis=0)
+        return [
+            dict(label=label, med=med[i], q1=q1[i], q3=q3[i],
+                 whislo=whislo[i], whishi=whishi[i], fliers=M[outside[:, i], i])
+            for i, label in enumerate(labels)
+        ]
 
     # ================================================================
     # 5. Histograms with mean, median, skewness, kurtosis
     # ================================================================
-    def histograms_distribution_stats(self, save_fig: bool = True, show: bool = True):
+    def histograms_distribution_stats(self, save_fig: bool = True, show: bool = True,
+                                      kde: bool = False):
         """
         Create histograms with distribution statistics for all numeric variables.
         
         Args:
             save_fig: Whether to save the figures to files
             show: Whether to display the figures
+            kde: Overlay a Gaussian KDE curve (extra scipy fit, off by default)
         """
-        numeric_cols = ["study_hours", "quiz_participation", "past_performance", "engagement"]
+        numeric_cols = self.NUMERIC_COLS
+        # All four statistics for every column in one agg() call, before the plotting loop
+        present_cols = [c for c in numeric_cols if c in self.df.columns]
+        stats = self.df[present_cols].agg(["mean", "median", "skew", "kurtosis"])
+        # Saved-only figures: one detached figure reused for every column
+        # (cleared per plot). Shown figures are finalised by
+        # plt.show(), so each column then gets its own figure
+        if not show:
+            fig, ax = self._subplots((8,5), show)
         for col in numeric_cols:
             if col not in self.df.columns:
                 print(f"Skipping {col} - column not found in data")
                 continue
                 
-            fig, ax = plt.subplots(figsize=(8,5))
-            sns.histplot(self.df[col], bins=20, kde=True, color="lightgreen", ax=ax)
-            mean = self.df[col].mean()
-            median = self.df[col].median()
-            skew = self.df[col].skew()
-            kurt = self.df[col].kurtosis()
+            if show:
+                fig, ax = self._subplots((8,5), show)
+            else:
+                ax.clear()
+            arr = self._num[col]
+            arr = arr[~np.isnan(arr)]
+            self._hist_with_kde(ax, arr, color="lightgreen", kde=kde, edgecolor="black", alpha=0.6)
+            mean, median = stats.at["mean", col], stats.at["median", col]
+            skew, kurt = stats.at["skew", col], stats.at["kurtosis", col]
             
-            ax.axvline(mean, color='red', linestyle='--', label=f"Mean={mean:.2f}")
-            ax.axvline(median, color='blue', linestyle='-', label=f"Median={median:.2f}")
+            # Mean and median markers as one LineCollection spanning the full
+            # axes height (x in data, y in axes coordinates, as axvline)
+            ax.add_collection(LineCollection(
+                [[(mean, 0), (mean, 1)], [(median, 0), (median, 1)]],
+                colors=['red', 'blue'], linestyles=['--', '-'],
+                transform=ax.get_xaxis_transform()), autolim=False)
             ax.set_title(f"{col} distribution (skew={skew:.2f}, kurtosis={kurt:.2f})")
             ax.set_xlabel(col)
             ax.set_ylabel("Count")
-            ax.legend()
-            plt.tight_layout()
+            # Proxy handles for the two collection segments
+            ax.legend(handles=[
+                Line2D([0], [0], color='red', linestyle='--', label=f"Mean={mean:.2f}"),
+                Line2D([0], [0], color='blue', linestyle='-', label=f"Median={median:.2f}"),
+            ])
             
             if save_fig:
                 self.save_figure(fig, f"{col}_distribution.png")
             if show:
                 plt.show()
-            plt.close(fig)
+                self._close(fig, show)
 
     # ================================================================
     # 6. Barplots for contingency tables (categorical variables)
     # ================================================================
-    def barplots_contingency_tables(self, save_fig: bool = True, show: bool = True):
+    def barplots_contingency_tables(self, save_fig: bool = True, show: bool = True,
+                                    normalize: bool = False):
         """
         Create bar plots for contingency tables of categorical variables.
         
         Args:
             save_fig: Whether to save the figures to files
             show: Whether to display the figures
+            normalize: Plot row proportions (each bar sums to 1) instead of counts
         """
+        if "course_completion" not in self.df.columns:
+            return
+        # One grouped count over all categorical keys; each 2-D table below is a
+        # cheap re-aggregation of it instead of a separate crosstab pass.
+        # dropna=False keeps rows with a missing key for the other tables.
+        keys = [c for c in ("gender", "age_bucket", "performance_level") if c in self.df.columns]
+        cat_df = self.df[keys + ["course_completion"]].astype("category")
+        counts = cat_df.groupby(keys + ["course_completion"], observed=True, dropna=False).size()
+        ylabel = "Proportion" if normalize else "Count"
+
         # gender × course_completion
-        if "gender" in self.df.columns and "course_completion" in self.df.columns:
-            fig, ax = plt.subplots(figsize=(6,5))
-            ct_gender = pd.crosstab(self.df["gender"], self.df["course_completion"])
+        if "gender" in keys:
+            fig, ax = self._subplots((6,5), show)
+            ct_gender = self._contingency_table(counts, "gender", normalize)
             ct_gender.plot(kind="bar", stacked=True, colormap="Set2", ax=ax)
             ax.set_title("Gender vs Course Completion")
             ax.set_xlabel("Gender")
-            ax.set_ylabel("Count")
+            ax.set_ylabel(ylabel)
             ax.legend(title="Course Completed")
-            plt.tight_layout()
             
             if save_fig:
                 self.save_figure(fig, "gender_vs_completion.png")
             if show:
                 plt.show()
-            plt.close(fig)
+            self._close(fig, show)
 
         # age_bucket × course_completion
-        if "age_bucket" in self.df.columns and "course_completion" in self.df.columns:
-            fig, ax = plt.subplots(figsize=(6,5))
-            ct_age = pd.crosstab(self.df["age_bucket"], self.df["course_completion"], 
-                               normalize='index' if 'normalized' in self.df.columns else 'all')
+        if "age_bucket" in keys:
+            fig, ax = self._subplots((6,5), show)
+            ct_age = self._contingency_table(counts, "age_bucket", normalize)
             ct_age.plot(kind="bar", stacked=True, colormap="Set3", ax=ax)
             ax.set_title("Age Bucket vs Course Completion")
             ax.set_xlabel("Age Bucket")
-            ax.set_ylabel("Proportion" if 'normalized' in self.df.columns else "Count")
+            ax.set_ylabel(ylabel)
             ax.legend(title="Course Completed")
-            plt.tight_layout()
             
             if save_fig:
                 self.save_figure(fig, "age_vs_completion.png")
             if show:
                 plt.show()
-            plt.close(fig)
+            self._close(fig, show)
 
         # performance_level × course_completion
-        if "performance_level" in self.df.columns and "course_completion" in self.df.columns:
-            fig, ax = plt.subplots(figsize=(8,5))
-            ct_perf = pd.crosstab(self.df["performance_level"], self.df["course_completion"])
+        if "performance_level" in keys:
+            fig, ax = self._subplots((8,5), show)
+            ct_perf = self._contingency_table(counts, "performance_level", normalize)
             ct_perf.plot(kind="bar", stacked=True, colormap="Paired", ax=ax)
             ax.set_title("Performance Level vs Course Completion")
             ax.set_xlabel("Performance Level")
-            ax.set_ylabel("Count")
+            ax.set_ylabel(ylabel)
             ax.legend(title="Course Completed")
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
+            ax.tick_params(axis="x", labelrotation=45)
+            for label in ax.get_xticklabels():
+                label.set_horizontalalignment("right")
             
             if save_fig:
                 self.save_figure(fig, "performance_vs_completion.png")
             if show:
                 plt.show()
-            plt.close(fig)
+            self._close(fig, show)
+
+    @staticmethod
+    def _contingency_table(counts: pd.Series, row_var: str, normalize: bool = False) -> pd.DataFrame:
+        """
+        Collapse the multi-key counts to a row_var × course_completion table
+        (same result as pd.crosstab, missing keys dropped).
+        """
+        table = (
+            counts.groupby(level=[row_var, "course_completion"], observed=True)
+            .sum()
+            .unstack(fill_value=0)
+        )
+        if normalize:
+            table = table.div(table.sum(axis=1), axis=0)
+        return table
 
 
 # ================================================================
 # Main execution
 # ================================================================
 def main():
+    # Batch run: figures are only saved, so use the non-interactive Agg
+    # backend (no GUI toolkit start-up or event-loop syncs)
+    matplotlib.use("Agg", force=True)
+    # Seaborn theme set once for the whole run (not at import, so importing
+    # the module does not restyle the caller's plots)
+    sns.set_theme(style="whitegrid")
+
     BASE_DIR = Path(__file__).resolve().parent.parent
     CLEANED_CSV = BASE_DIR / "data" / "students_cleaned.csv"
 
     # Create visualizer and ensure output directory exists
-    visualizer = DataVisualizer(csv_path=CLEANED_CSV)
+    # Report figures: full 300 dpi, default PNG compression
+    visualizer = DataVisualizer(csv_path=CLEANED_CSV, quality="final")
     print(f"Saving visualizations to: {visualizer.figures_dir}")
 
-    # Mandatory visualisations
-    print("\nGenerating mandatory visualizations...")
-    visualizer.scatter_study_vs_performance(save_fig=True, show=False)
-    visualizer.histogram_quiz_participation(save_fig=True, show=False)
-    visualizer.bar_engagement_by_completion(save_fig=True, show=False)
-
-    # Extended visualisations
-    print("\nGenerating extended visualizations...")
-    visualizer.boxplots_numeric(save_fig=True, show=False)
-    visualizer.histograms_distribution_stats(save_fig=True, show=False)
-    visualizer.barplots_contingency_tables(save_fig=True, show=False)
-    
+    # The six plots are independent and each thread owns its own Figure.
+    # Agg rasterisation and PNG encoding release the GIL, so rendering and
+    # saving run in parallel
+    print("\nGenerating mandatory and extended visualizations...")
+    plots = [
+        # Mandatory visualisations
+        visualizer.scatter_study_vs_performance,
+        visualizer.histogram_quiz_participation,
+        visualizer.bar_engagement_by_completion,
+        # Extended visualisations
+        visualizer.boxplots_numeric,
+        visualizer.histograms_distribution_stats,
+        visualizer.barplots_contingency_tables,
+    ]
+    with ThreadPoolExecutor(max_workers=len(plots)) as pool:
+        futures = [pool.submit(plot, save_fig=True, show=False) for plot in plots]
+        for future in futures:
+            future.result()  # re-raise any error from a worker
+
     print("\nAll visualizations have been generated and saved.")
 
 
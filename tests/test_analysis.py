@@ -0,0 +1,145 @@
+import unittest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from analysis import DataAnalyzer
+from data_cleaning import DataCleaner
+from data_generator import StudentGenerator
+from data_io import sidecar_path
+
+class TestDataAnalysis(unittest.TestCase):
+    """Test suite for the DataAnalyzer class in analysis.py"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small cleaned dataset and load it into a DataAnalyzer"""
+        test_data_generator = StudentGenerator(n_students=50, seed=42)
+        test_data = test_data_generator._generate_chunk(0, 50, add_nan=True)
+
+        cls.raw_file_path = 'test_analysis_raw.csv'
+        cls.test_file_path = 'test_analysis_cleaned.csv'
+        test_data.to_csv(cls.raw_file_path, index=False)
+
+        cleaner = DataCleaner(cls.raw_file_path)
+        cleaner.convert_types()
+        cleaner.handle_missing_values()
+        cleaner.correct_anomalies()
+        cleaner.normalize_columns()
+        cleaner.create_engagement()
+        cleaner.bucket_age()
+        cleaner.save_cleaned_data(cls.test_file_path)
+
+        cls.analyzer = DataAnalyzer(cls.test_file_path)
+
+    def test_unused_text_columns_dropped(self):
+        """Test that name/email columns are dropped and student_id is kept"""
+        for column in DataAnalyzer.UNUSED_TEXT_COLUMNS:
+            self.assertNotIn(column, self.analyzer.df.columns)
+        self.assertIn('student_id', self.analyzer.df.columns)
+
+    def test_summary_statistics(self):
+        """Test summary statistics against the pandas reductions"""
+        result = self.analyzer.summary_statistics()
+        data = self.analyzer.df['quiz_participation']
+
+        self.assertAlmostEqual(result['quiz_part_mean'], data.mean())
+        self.assertAlmostEqual(result['quiz_part_median'], data.median())
+        self.assertAlmostEqual(result['quiz_part_std'], data.std())
+
+    def test_correlation_matrix(self):
+        """Test that correlation_matrix matches pandas' Pearson correlation"""
+        result = self.analyzer.correlation_matrix()
+        expected = self.analyzer.df.select_dtypes(include=[np.number]).corr()
+
+        self.assertListEqual(list(result.columns), list(expected.columns))
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-10)
+
+    def test_correlation_matrix_spearman(self):
+        """Test that the symmetric pairwise path matches pandas' Spearman correlation"""
+        result = self.analyzer.correlation_matrix(method='spearman')
+        expected = self.analyzer.df.select_dtypes(include=[np.number]).corr(method='spearman')
+
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-10)
+        np.testing.assert_allclose(result.to_numpy(), result.to_numpy().T)
+
+    def test_group_analysis(self):
+        """Test that group_analysis matches a default sorted groupby"""
+        result = self.analyzer.group_analysis()
+        expected = self.analyzer.df.groupby('course_completion')['engagement'].mean()
+
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_classify_performance(self):
+        """Test the High/Medium/Low thresholds of classify_performance"""
+        result = self.analyzer.classify_performance()
+        scores = result['past_performance']
+        levels = result['performance_level']
+
+        self.assertTrue((levels[scores >= 85] == 'High').all())
+        self.assertTrue((levels[(scores >= 60) & (scores < 85)] == 'Medium').all())
+        self.assertTrue((levels[scores < 60] == 'Low').all())
+
+    def test_distribution_shape(self):
+        """Test that the single-pass moments match the pandas reductions"""
+        result = self.analyzer.distribution_shape('study_hours')
+        data = self.analyzer.df['study_hours']
+
+        self.assertAlmostEqual(result['mean'], data.mean())
+        self.assertAlmostEqual(result['median'], data.median())
+        self.assertAlmostEqual(result['std'], data.std())
+        self.assertAlmostEqual(result['skewness'], data.skew())
+        self.assertAlmostEqual(result['kurtosis'], data.kurtosis())
+        self.assertAlmostEqual(result['iqr'], data.quantile(0.75) - data.quantile(0.25))
+
+        # A constant column has zero skewness and kurtosis, as in pandas
+        constant = pd.Series([5.0] * 10)
+        original_df = self.analyzer.df
+        self.analyzer.df = pd.DataFrame({'study_hours': constant})
+        try:
+            result = self.analyzer.distribution_shape('study_hours')
+        finally:
+            self.analyzer.df = original_df
+        self.assertEqual(result['skewness'], constant.skew())
+        self.assertEqual(result['kurtosis'], constant.kurtosis())
+        self.assertEqual(result['std'], 0.0)
+
+    def test_outlier_detection(self):
+        """Test the outlier count against a plain pandas mask"""
+        result = self.analyzer.outlier_detection('past_performance', multiplier=1.0)
+        data = self.analyzer.df['past_performance']
+        mask = (data < result['lower_bound']) | (data > result['upper_bound'])
+
+        self.assertEqual(result['n_outliers'], int(mask.sum()))
+
+    def test_contingency_tables(self):
+        """Test that the shared-code tables match pd.crosstab with margins"""
+        self.analyzer.classify_performance()
+        tables = self.analyzer.contingency_tables()
+
+        row_vars = {
+            'gender_course_completion': 'gender',
+            'age_course_completion': 'age_bucket',
+            'performance_course_completion': 'performance_level',
+        }
+        for name, row_var in row_vars.items():
+            expected = pd.crosstab(
+                self.analyzer.df[row_var], self.analyzer.df['course_completion'], margins=True
+            )
+            pd.testing.assert_frame_equal(tables[name], expected)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests are done"""
+        for csv_path in (cls.raw_file_path, cls.test_file_path):
+            for path in (csv_path, str(sidecar_path(csv_path))):
+                if os.path.exists(path):
+                    os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
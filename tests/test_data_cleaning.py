@@ -10,6 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 from data_cleaning import DataCleaner
 from data_generator import StudentGenerator
+from data_io import load_csv, sidecar_path
 
 class TestDataCleaning(unittest.TestCase):
     """Test suite for the DataCleaner class in data_cleaning.py"""
@@ -23,12 +24,12 @@ class TestDataCleaning(unittest.TestCase):
         # Generate test data with 50 student records
         cls.test_data = test_data_generator.generate_dataset(add_nan=False)
         
-        # Save test data to a temporary CSV file
+        # Save test data to a temporary CSV file (used by the load_csv tests)
         cls.test_file_path = 'test_student_data.csv'
         cls.test_data.to_csv(cls.test_file_path, index=False)
         
-        # Initialize DataCleaner with test data
-        cls.data_cleaner = DataCleaner(cls.test_file_path)
+        # Initialize DataCleaner with test data, in memory (no CSV round trip)
+        cls.data_cleaner = DataCleaner.from_df(cls.test_data.copy())
     
     def test_initialization(self):
         """Test if DataCleaner initializes correctly with valid data"""
@@ -41,11 +42,38 @@ class TestDataCleaning(unittest.TestCase):
         for column in required_columns:
             self.assertIn(column, self.data_cleaner.df.columns)
     
+    def test_csv_sidecar_cache(self):
+        """Test that loading a CSV writes a Parquet sidecar and reads it back"""
+        sidecar = sidecar_path(self.test_file_path)
+        parsed = load_csv(self.test_file_path)
+        self.assertTrue(sidecar.exists())
+
+        cached = load_csv(self.test_file_path)
+        pd.testing.assert_frame_equal(cached, parsed)
+        pd.testing.assert_frame_equal(cached, pd.read_parquet(sidecar))
+        self.assertEqual(len(cached), len(self.test_data))
+
+    def test_load_csv_dtype_map(self):
+        """Test that load_csv casts mapped columns, skips absent ones and keeps the sidecar lossless"""
+        cast = load_csv(self.test_file_path, dtype={'study_hours': 'float32', 'engagement': 'float32'})
+        self.assertEqual(cast['study_hours'].dtype, np.float32)
+        self.assertNotIn('engagement', cast.columns)
+        self.assertEqual(pd.read_parquet(sidecar_path(self.test_file_path))['study_hours'].dtype, np.float64)
+
+    def test_load_csv_column_subset(self):
+        """Test that load_csv returns only the requested (existing) columns from the sidecar"""
+        subset = load_csv(self.test_file_path, columns=['gender', 'study_hours', 'engagement'])
+        self.assertListEqual(list(subset.columns), ['gender', 'study_hours'])
+        self.assertEqual(len(pd.read_parquet(sidecar_path(self.test_file_path)).columns),
+                         len(self.test_data.columns))
+
     def test_remove_duplicates(self):
         """Test if remove_duplicates() works correctly"""
         # Create a copy of the dataframe with duplicates
         original_length = len(self.data_cleaner.df)
-        df_with_duplicates = pd.concat([self.data_cleaner.df, self.data_cleaner.df.iloc[[0]]])
+        # Append a copy of the first row under a new label (no concat of the whole frame)
+        df_with_duplicates = self.data_cleaner.df.copy(deep=False)
+        df_with_duplicates.loc[df_with_duplicates.index.max() + 1] = self.data_cleaner.df.iloc[0]
         
         # Apply remove_duplicates
         self.data_cleaner.df = df_with_duplicates
@@ -81,6 +109,22 @@ class TestDataCleaning(unittest.TestCase):
         self.assertGreaterEqual(len(self.data_cleaner.df), original_study_hours_count - 1)
         self.assertGreaterEqual(len(self.data_cleaner.df), original_gender_count - 1)
     
+    def test_email_reconstruction(self):
+        """Test that missing emails are rebuilt from student_id like generate_email()"""
+        original_df = self.data_cleaner.df
+        self.data_cleaner.df = original_df.copy()
+        self.data_cleaner.df['gender'] = self.data_cleaner.df['gender'].astype('category')
+        self.data_cleaner.df.loc[[0, 2, 5], 'email'] = None
+
+        self.data_cleaner.handle_missing_values()
+
+        for idx in [0, 2, 5]:
+            expected = StudentGenerator.generate_email(self.data_cleaner.df.loc[idx, 'student_id'])
+            self.assertEqual(self.data_cleaner.df.loc[idx, 'email'], expected)
+
+        # Restore the shared fixture for the remaining tests
+        self.data_cleaner.df = original_df
+
     def test_convert_types(self):
         """Test if data types are correctly converted"""
         # Apply type conversion
@@ -89,7 +133,22 @@ class TestDataCleaning(unittest.TestCase):
         # Check if course_completion is boolean
         if 'course_completion' in self.data_cleaner.df.columns:
             self.assertTrue(pd.api.types.is_bool_dtype(self.data_cleaner.df['course_completion']))
-    
+
+    def test_convert_types_boolean_variants(self):
+        """Test that the string variants of course_completion map to the right booleans"""
+        original_df = self.data_cleaner.df
+        self.data_cleaner.df = original_df.head(8).copy()
+        self.data_cleaner.df['course_completion'] = [
+            'Yes', '1', 'Completed', 'TRUE', 'No', '0', 'Incomplete', np.nan
+        ]
+        self.data_cleaner.convert_types()
+
+        expected = [True, True, True, True, False, False, False, False]
+        self.assertEqual(self.data_cleaner.df['course_completion'].tolist(), expected)
+
+        # Restore the shared fixture for the remaining tests
+        self.data_cleaner.df = original_df
+
     def test_normalize_columns(self):
         """Test if numerical columns are properly normalized"""
         # Skip if there are no numeric columns to test
@@ -132,13 +191,64 @@ class TestDataCleaning(unittest.TestCase):
         self.assertIn('age_bucket', self.data_cleaner.df.columns)
         expected_categories = ['19-24', '25-34', '35-45', '46+']
         self.assertTrue(all(cat in expected_categories for cat in self.data_cleaner.df['age_bucket'].unique()))
+        self.assertTrue(self.data_cleaner.df['age_bucket'].cat.ordered)
+
+    def test_bucket_age_matches_cut(self):
+        """Test bucket edges, fractional ages and NaN against pd.cut"""
+        original_df = self.data_cleaner.df
+        ages = [0, 19, 24, 24.5, 34, 35, 45, 45.5, 100, 101, -1, np.nan]
+        self.data_cleaner.df = pd.DataFrame({'age': ages})
+        self.data_cleaner.bucket_age()
+
+        expected = pd.cut(pd.Series(ages, name='age_bucket'), bins=[0, 24, 34, 45, 100],
+                          labels=['19-24', '25-34', '35-45', '46+'],
+                          include_lowest=True, ordered=True)
+        pd.testing.assert_series_equal(self.data_cleaner.df['age_bucket'], expected)
+
+        # Restore the shared fixture for the remaining tests
+        self.data_cleaner.df = original_df
     
+    def test_run_pipeline_matches_sequential_steps(self):
+        """Test that the fused pipeline produces the same frame as the individual steps"""
+        sequential = DataCleaner.from_df(self.test_data.copy())
+        sequential.remove_duplicates()
+        sequential.convert_types()
+        sequential.handle_missing_values()
+        sequential.correct_anomalies()
+        sequential.normalize_columns()
+        sequential.create_engagement()
+        sequential.bucket_age()
+
+        fused = DataCleaner.from_df(self.test_data.copy())
+        fused.run_pipeline()
+
+        pd.testing.assert_frame_equal(fused.df, sequential.df)
+
+    def test_save_cleaned_data_parquet(self):
+        """Test that cleaned data is saved as Parquet and keeps its dtypes on reload"""
+        cleaner = DataCleaner.from_df(self.test_data.copy())
+        cleaner.run_pipeline()
+        output_path = 'test_student_data_cleaned.csv'
+        try:
+            cleaner.save_cleaned_data(output_path)
+            self.assertFalse(os.path.exists(output_path))
+
+            reloaded = load_csv(output_path)
+            self.assertTrue(pd.api.types.is_bool_dtype(reloaded['course_completion']))
+            self.assertIsInstance(reloaded['age_bucket'].dtype, pd.CategoricalDtype)
+            self.assertEqual(len(reloaded), len(cleaner.df))
+        finally:
+            for path in (output_path, str(sidecar_path(output_path))):
+                if os.path.exists(path):
+                    os.remove(path)
+
     @classmethod
     def tearDownClass(cls):
         """Clean up after all tests are done"""
-        # Remove the temporary test file
-        if os.path.exists(cls.test_file_path):
-            os.remove(cls.test_file_path)
+        # Remove the temporary test file and its Parquet sidecar
+        for path in (cls.test_file_path, str(sidecar_path(cls.test_file_path))):
+            if os.path.exists(path):
+                os.remove(path)
 
 if __name__ == '__main__':
     unittest.main()
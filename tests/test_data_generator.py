@@ -0,0 +1,118 @@
+import unittest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from data_cleaning import DataCleaner
+from data_generator import StudentGenerator
+from data_io import sidecar_path
+
+class TestStudentGenerator(unittest.TestCase):
+    """Test suite for the StudentGenerator class in data_generator.py"""
+
+    def setUp(self):
+        self.output_path = Path('test_students_chunked.parquet')
+
+    def test_generate_dataset_chunked(self):
+        """Test that streamed chunks form one dataset with consecutive IDs and stable dtypes"""
+        generator = StudentGenerator(n_students=250, seed=42)
+        generator.generate_dataset_chunked(chunk_size=100, output_path=self.output_path)
+        df = pd.read_parquet(self.output_path)
+
+        self.assertEqual(len(df), 250)
+        self.assertListEqual(list(df['student_id']), [f"S{i:03d}" for i in range(1, 251)])
+        self.assertListEqual(list(df['email'].iloc[[0, 249]]), ['x001@student.ncirl.ie', 'x250@student.ncirl.ie'])
+        self.assertEqual(df['study_hours'].dtype, 'float64')
+        self.assertEqual(df['course_completion'].dtype, 'boolean')
+        self.assertIsInstance(df['gender'].dtype, pd.CategoricalDtype)
+        self.assertListEqual(list(df['gender'].cat.categories), list(StudentGenerator.GENDERS))
+
+    def test_generate_dataset_empty(self):
+        """Test that generating zero students gives an empty dataset instead of failing"""
+        ids, emails = StudentGenerator.generate_ids_and_emails(0)
+        self.assertEqual((ids.size, emails.size), (0, 0))
+
+        generator = StudentGenerator(n_students=0, seed=42)
+        generator.CSV_PATH = Path('test_students_empty.csv')
+        generator.PARQUET_PATH = sidecar_path(generator.CSV_PATH)
+        try:
+            df = generator.generate_dataset(add_nan=False)
+            self.assertEqual(len(df), 0)
+            self.assertIn('student_id', df.columns)
+            self.assertEqual(len(pd.read_parquet(generator.PARQUET_PATH)), 0)
+        finally:
+            if os.path.exists(generator.PARQUET_PATH):
+                os.remove(generator.PARQUET_PATH)
+
+        # The chunked writer still writes a (schema-only) file
+        generator.generate_dataset_chunked(chunk_size=100, output_path=self.output_path)
+        chunked = pd.read_parquet(self.output_path)
+        self.assertEqual(len(chunked), 0)
+        self.assertListEqual(list(chunked.columns), list(df.columns))
+
+    def test_boolean_inconsistencies_map_back(self):
+        """Test that every injected course_completion variant converts back to its original boolean"""
+        generator = StudentGenerator(n_students=2000, seed=42)
+        df = generator._generate_chunk(0, 2000, add_nan=False)
+        original = df['course_completion'].to_numpy(dtype=bool)
+
+        generator.introduce_boolean_inconsistencies(df)
+        injected = df['course_completion'].map(lambda v: isinstance(v, str)).to_numpy()
+        self.assertTrue(0.02 < injected.mean() < 0.06)
+
+        converted = DataCleaner.from_df(df).convert_types()['course_completion'].to_numpy()
+        np.testing.assert_array_equal(converted, original)
+
+    def test_value_inconsistencies(self):
+        """Test the injected fractions and that injected values parse back to the originals"""
+        n = 5000
+        generator = StudentGenerator(n_students=n, seed=42)
+        df = generator._generate_chunk(0, n, add_nan=False)
+        original = df[['age', 'study_hours', 'quiz_participation', 'past_performance']].copy()
+
+        generator.introduce_value_inconsistencies(df)
+
+        # Text placeholders (~2% each) coerce to NaN, everything else is unchanged
+        for col, marker in (('age', 'unknown'), ('study_hours', 'various')):
+            injected = (df[col] == marker).to_numpy()
+            self.assertTrue(0.01 < injected.mean() < 0.03)
+            parsed = pd.to_numeric(df[col], errors='coerce')
+            self.assertTrue(parsed[injected].isna().all())
+            np.testing.assert_array_equal(parsed[~injected], original[col][~injected])
+
+        # Past performance as a fraction (~2%)
+        perf = df['past_performance'].to_numpy(dtype=np.float64)
+        scaled = perf != original['past_performance'].to_numpy()
+        self.assertTrue(0.01 < scaled.mean() < 0.03)
+        np.testing.assert_allclose(perf[scaled], original['past_performance'].to_numpy()[scaled] / 100)
+
+        # Quiz participation (~3%) as "72.5%", 0.725 or 0.73
+        quiz = df['quiz_participation'].to_numpy()
+        orig_quiz = original['quiz_participation'].to_numpy()
+        altered = np.array([not (isinstance(v, float) and v == o) for v, o in zip(quiz, orig_quiz)])
+        self.assertTrue(0.015 < altered.mean() < 0.045)
+        for value, orig in zip(quiz[altered], orig_quiz[altered]):
+            if isinstance(value, str):
+                self.assertTrue(value.endswith('%'))
+                self.assertAlmostEqual(float(value[:-1]), orig)
+            else:
+                self.assertIn(value, (orig / 100, round(orig / 100, 2)))
+
+        # convert_types turns every column numeric; only text placeholders and "%" strings become NaN
+        converted = DataCleaner.from_df(df).convert_types()
+        for col in original.columns:
+            self.assertTrue(pd.api.types.is_numeric_dtype(converted[col]))
+        percent = np.array([isinstance(v, str) for v in quiz])
+        np.testing.assert_array_equal(converted['quiz_participation'].isna().to_numpy(), percent)
+
+    def tearDown(self):
+        if os.path.exists(self.output_path):
+            os.remove(self.output_path)
+
+if __name__ == '__main__':
+    unittest.main()